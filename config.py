@@ -1,4 +1,6 @@
+import functools
 import os
+import random
 from typing import Dict, Optional
 from dotenv import load_dotenv
 import logging
@@ -10,88 +12,71 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
-# Log loaded environment variables
-logger.info(f"Loaded environment variables: {os.environ.keys()}")
+# Snapshot environment-driven settings once at import
+_TIMEOUT = int(os.getenv("CONTENT_ANALYZER_TIMEOUT") or 300000)
+_DELAY = float(os.getenv("CONTENT_ANALYZER_DELAY") or 10.0)
+_RETRIES = int(os.getenv("CONTENT_ANALYZER_RETRIES") or 20)
+_OUTPUT_DIR = os.getenv("OUTPUT_DIR", "output")
+_CACHE_DIR = os.getenv("CACHE_DIR", ".cache")
+_PROXY = os.getenv("CONTENT_ANALYZER_PROXY") or None
+_BASE_URL = os.getenv("CONTENT_ANALYZER_BASE_URL") or None
+_MAX_CONCURRENCY = int(os.getenv("CONTENT_ANALYZER_MAX_CONCURRENCY") or 4)
+_PER_HOST_CONCURRENCY = int(os.getenv("CONTENT_ANALYZER_PER_HOST_CONCURRENCY") or 2)
 
 class AppConfig:
     """Configuration class for the application."""
     
+    # Scraping configuration
+    BASE_URL = _BASE_URL  # Default start page for URL discovery
+    USER_AGENTS = [
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0',
+        'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15'
+    ]
+    
+    # Batch configuration
+    BATCH_SIZE = 1  # Process one URL at a time
+    DEFAULT_DELAY = _DELAY
+    MAX_CONCURRENCY = _MAX_CONCURRENCY  # URLs in flight across all hosts
+    PER_HOST_CONCURRENCY = _PER_HOST_CONCURRENCY  # URLs in flight per host
+    
+    # Output configuration
+    OUTPUT_DIR = _OUTPUT_DIR  # Created on first write by get_output_dir()
+    
     def __init__(self):
-        # Load environment variables
-        load_dotenv()
-        
         # API configuration
         self.API_KEY = os.getenv('CONTENT_ANALYZER_API_KEY')
         self.API_URL = os.getenv('CONTENT_ANALYZER_API_URL', 'http://localhost:8000/api')
         
-        # Scraping configuration
-        self.USER_AGENTS = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:89.0) Gecko/20100101 Firefox/89.0',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari/605.1.15'
-        ]
-        
         # Network configuration
         self.TIMEOUT = 300000  # 5 minute timeout
         self.DELAY = 10.0  # Increased delay for MoEngage
-        self.BATCH_SIZE = 1  # Process one URL at a time
         self.RETRIES = 20  # Increased retries for MoEngage
         
         # Output configuration
-        self.OUTPUT_DIR = os.getenv("OUTPUT_DIR", "output")
+        self.OUTPUT_DIR = _OUTPUT_DIR
         
         # Proxy configuration
         self.PROXY = os.getenv('CONTENT_ANALYZER_PROXY', "http://127.0.0.1:8080")  # Local proxy for testing
         
         # Validate required settings
         if not self.API_KEY:
-            raise ValueError("API_KEY must be provided in environment variables")
+            logger.error("API key not found in environment variables")
+            raise ValueError("API key not found. Please set CONTENT_ANALYZER_API_KEY in your .env file")
         
         # Log configuration
         self.LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
         self.LOG_FILE = os.getenv('LOG_FILE', 'content_analyzer.log')
         
-    @staticmethod
-    def get_user_agent() -> str:
-        """Get a random user agent from the list."""
-        return random.choice(AppConfig().USER_AGENTS)
-    
-    @staticmethod
-    def get_api_key() -> str:
-        """Get the API key."""
-        return AppConfig().API_KEY
-    
-    @classmethod
-    def get_delay(cls) -> float:
-        """Get random delay between min and max values."""
-        import random
-        min_delay = cls().DELAY * 0.8
-        max_delay = cls().DELAY * 1.2
-        return random.uniform(min_delay, max_delay)
-    
-    @classmethod
-    def get_proxy(cls) -> Optional[str]:
-        """Get proxy configuration from environment variables."""
-        return cls().PROXY
-        proxy = os.getenv("CONTENT_ANALYZER_PROXY")
-        if proxy:
-            return proxy
-        return cls.PROXY
-    
     @classmethod
     def get_user_agent(cls) -> str:
         """Get a random user agent."""
-        import random
         return random.choice(cls.USER_AGENTS)
     
     @classmethod
     def get_api_key(cls) -> str:
         """Get the API key from environment variables."""
-        api_key = os.getenv("CONTENT_ANALYZER_API_KEY")
-        if not api_key:
-            logger.error("API key not found in environment variables")
-            raise ValueError("API key not found. Please set CONTENT_ANALYZER_API_KEY in your .env file")
-        return api_key
+        return _get_instance().API_KEY
     
     @classmethod
     def is_api_key_valid(cls) -> bool:
@@ -102,16 +87,14 @@ class AppConfig:
     @classmethod
     def get_output_dir(cls) -> str:
         """Get the default output directory."""
-        output_dir = os.getenv("OUTPUT_DIR", "output")
-        os.makedirs(output_dir, exist_ok=True)
-        return output_dir
+        os.makedirs(_OUTPUT_DIR, exist_ok=True)
+        return _OUTPUT_DIR
     
     @classmethod
     def get_cache_dir(cls) -> str:
         """Get the cache directory for storing intermediate results."""
-        cache_dir = os.getenv("CACHE_DIR", ".cache")
-        os.makedirs(cache_dir, exist_ok=True)
-        return cache_dir
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        return _CACHE_DIR
     
     @classmethod
     def get_default_headers(cls) -> Dict[str, str]:
@@ -133,28 +116,25 @@ class AppConfig:
     @classmethod
     def get_proxy(cls) -> Optional[str]:
         """Get proxy configuration from environment variables."""
-        return os.getenv("CONTENT_ANALYZER_PROXY")
+        return _PROXY
     
     @classmethod
     def get_timeout(cls) -> int:
         """Get the timeout in milliseconds."""
-        timeout = os.getenv("CONTENT_ANALYZER_TIMEOUT")
-        if timeout:
-            return int(timeout)
-        return cls.TIMEOUT
+        return _TIMEOUT
     
     @classmethod
     def get_delay(cls) -> float:
         """Get the delay between requests."""
-        delay = os.getenv("CONTENT_ANALYZER_DELAY")
-        if delay:
-            return float(delay)
-        return cls.DEFAULT_DELAY
+        return _DELAY
     
     @classmethod
     def get_retries(cls) -> int:
         """Get the number of retries."""
-        retries = os.getenv("CONTENT_ANALYZER_RETRIES")
-        if retries:
-            return int(retries)
-        return cls.MAX_RETRIES
+        return _RETRIES
+
+
+@functools.lru_cache(maxsize=1)
+def _get_instance() -> AppConfig:
+    """Get the shared configuration, built once from the loaded environment."""
+    return AppConfig()
@@ -1,36 +1,154 @@
-import json
-import textstat
+import hashlib
+import multiprocessing
+import os
+import statistics
+import threading
+import ijson
+import orjson
 import re
-from typing import Dict, List, Optional
-from bs4 import BeautifulSoup
-from nltk.tokenize import sent_tokenize
-from nltk import download
-from nltk.sentiment import SentimentIntensityAnalyzer
+from collections import Counter
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional
 from config import AppConfig
 
+# Use google-re2's linear-time engine for the large alternations when available
+try:
+    import re2 as fast_re
+except ImportError:
+    fast_re = re
+
+# Precompiled patterns shared by the analyze_* methods
+_PASSIVE_RE = fast_re.compile(r'\b(?:is|are|was|were|be|being|been)\b')
+_TOKEN_RE = re.compile(r'\w+')
+# Lowercased tokens counted for second-person voice and technical jargon
+_SECOND_PERSON = frozenset({'you', 'your'})
+_TECH_TERMS = frozenset({
+    'api', 'sdk', 'integration', 'analytics', 'metrics',
+    'segmentation', 'campaign', 'automation', 'trigger', 'event'
+})
+_TERM_GROUPS = {**dict.fromkeys(_SECOND_PERSON, 'you'), **dict.fromkeys(_TECH_TERMS, 'tech')}
+_SECTION_SPLIT_RE = re.compile(r'\n\n+|\n\s*[-=]+\s*\n')
+_HEADING_RE = re.compile(r'[A-Z][^\n]*$|\d+\.\s+|[A-Za-z0-9]+\.')
+_BULLET_RE = re.compile(r'\n\s*[•-]\s+')
+# Scoped inline flag: re2.compile takes an Options object, not re's int flags
+_EXAMPLE_RE = fast_re.compile(r'(?i:\b(?:Example|For example|To illustrate|Consider this example)\b)')
+_STEP_RE = re.compile(r'\b(?:Step \d+|1\.|2\.|3\.)\b')
+_SECTION_KEYWORDS = ('prerequisites', 'setup', 'configuration', 'troubleshooting')
+
+def _count_terms(content: str) -> Counter:
+    """Count passive-voice, second-person and technical terms."""
+    # One lowercase copy plus set lookups replaces case-insensitive regex matching
+    tokens = _TOKEN_RE.findall(content.lower())
+    counts = Counter(filter(None, map(_TERM_GROUPS.get, tokens)))
+    # Passive-voice markers are matched case-sensitively, so they scan the original
+    counts['passive'] = len(_PASSIVE_RE.findall(content))
+    return counts
+
+def _find_keywords(lowered: str) -> Dict[str, bool]:
+    """Check which section keywords occur in lowercased text."""
+    # Four C-level substring searches beat any per-match Python loop here
+    return {keyword: keyword in lowered for keyword in _SECTION_KEYWORDS}
+
+# textstat and nltk are heavy imports, so they load on first use
+_TEXTSTAT = None
+_PUNKT = None
+
+def _get_textstat():
+    """Get the textstat module, importing it on first use."""
+    global _TEXTSTAT
+    if _TEXTSTAT is None:
+        import textstat
+        _TEXTSTAT = textstat
+    return _TEXTSTAT
+
+def _get_punkt():
+    """Get the English Punkt sentence tokenizer used by sent_tokenize."""
+    global _PUNKT
+    if _PUNKT is None:
+        import nltk
+        # nltk 3.9+ ships the model as punkt_tab; older releases only have the pickle
+        try:
+            from nltk.tokenize import PunktTokenizer
+        except ImportError:
+            PunktTokenizer = None
+        resource, package = (
+            ('tokenizers/punkt_tab/english/', 'punkt_tab') if PunktTokenizer is not None
+            else ('tokenizers/punkt', 'punkt')
+        )
+        # Fetch the tokenizer only when it is not already installed
+        try:
+            nltk.data.find(resource)
+        except LookupError:
+            nltk.download(package, quiet=True)
+        if PunktTokenizer is not None:
+            _PUNKT = PunktTokenizer('english')
+        else:
+            _PUNKT = nltk.data.load('tokenizers/punkt/english.pickle')
+    return _PUNKT
+
+def _sentence_lengths(content: str) -> List[int]:
+    """Get the word count of every sentence in content."""
+    # Slicing a span and splitting it in C beats iterating Match objects per word
+    return [
+        len(content[start:end].split())
+        for start, end in _get_punkt().span_tokenize(content)
+    ]
+
+_SIA = None
+
+def _get_sia():
+    """Get the shared sentiment analyzer, loading its lexicon on first use."""
+    global _SIA
+    if _SIA is None:
+        from nltk.sentiment import SentimentIntensityAnalyzer
+        _SIA = SentimentIntensityAnalyzer()
+    return _SIA
+
 class ContentAnalyzer:
     """Analyzer for evaluating documentation content quality."""
     
     def __init__(self):
         self.api_key = AppConfig.get_api_key()
-        self.sia = SentimentIntensityAnalyzer()
-        download('punkt')  # Download NLTK tokenizer
         
-    def analyze_readability(self, content: str) -> Dict:
+    def analyze_readability(self, content: str, term_counts: Optional[Counter] = None,
+                            sentence_lengths: Optional[List[int]] = None) -> Dict:
         """Analyze content readability for marketers."""
+        if term_counts is None:
+            term_counts = _count_terms(content)
+        if sentence_lengths is None:
+            sentence_lengths = _sentence_lengths(content)
+        
+        # Count words, sentences and syllables once for both grade formulas
+        textstat = _get_textstat()
+        words = textstat.lexicon_count(content)
+        if words:
+            words_per_sentence = words / textstat.sentence_count(content)
+            syllables = textstat.syllable_count(content)
+            polysyllables_pct = 100 * textstat.polysyllabcount(content) / words
+            # Digit- or symbol-only text has words but no syllables; like textstat,
+            # report grade 0.0 rather than the formula's negative intercept
+            if syllables:
+                flesch_kincaid_grade = round(
+                    0.39 * words_per_sentence + 11.8 * syllables / words - 15.59, 1
+                )
+            else:
+                flesch_kincaid_grade = 0.0
+            gunning_fog = round(0.4 * (words_per_sentence + polysyllables_pct), 2)
+        else:
+            flesch_kincaid_grade = gunning_fog = 0.0
+        
         analysis = {
-            'flesch_kincaid_grade': textstat.flesch_kincaid_grade(content),
-            'gunning_fog': textstat.gunning_fog(content),
-            'sentences': sent_tokenize(content),
-            'sentiment': self.sia.polarity_scores(content)
+            'flesch_kincaid_grade': flesch_kincaid_grade,
+            'gunning_fog': gunning_fog,
+            'sentiment': _get_sia().polarity_scores(content)
         }
         
         # Calculate average sentence length
-        sentences = analysis['sentences']
-        avg_sentence_length = sum(len(s.split()) for s in sentences) / len(sentences)
+        sentence_count = len(sentence_lengths)
+        avg_sentence_length = statistics.fmean(sentence_lengths) if sentence_lengths else 0.0
         
         # Analyze technical terms
-        technical_terms = len(re.findall(r'\b(?:API|SDK|Integration|Analytics|Metrics|Segmentation|Campaign|Automation|Trigger|Event)\b', content, re.IGNORECASE))
+        technical_terms = term_counts['tech']
         
         # Determine readability score
         fk_grade = analysis['flesch_kincaid_grade']
@@ -56,7 +174,7 @@ class ContentAnalyzer:
                 "Break down long sentences into shorter, more digestible chunks"
             )
         
-        if technical_terms > len(sentences) * 0.2:  # More than 20% technical terms
+        if technical_terms > sentence_count * 0.2:  # More than 20% technical terms
             assessment['recommendations'].append(
                 "Add more business-focused explanations alongside technical terms"
             )
@@ -66,7 +184,7 @@ class ContentAnalyzer:
     def analyze_structure(self, content: str) -> Dict:
         """Analyze content structure and flow."""
         # Split content into sections using common heading patterns
-        sections = re.split(r'\n\n+|\n\s*[-=]+\s*\n', content)
+        sections = _SECTION_SPLIT_RE.split(content)
         
         # Count headings and paragraphs
         headings = []
@@ -79,24 +197,22 @@ class ContentAnalyzer:
                 continue
                 
             # Check if this is a heading
-            if re.match(r'^[A-Z][^\n]*$', section) or \
-               re.match(r'^\d+\.\s+', section) or \
-               re.match(r'^[A-Za-z0-9]+\.', section):
+            if _HEADING_RE.match(section):
                 headings.append(section)
             else:
                 # Count bullet points in paragraphs
-                bullet_points = re.findall(r'\n\s*[•-]\s+', section)
+                bullet_points = _BULLET_RE.findall(section)
                 lists += len(bullet_points)
                 paragraphs.append(section)
                 
         # Analyze paragraph length
-        long_paragraphs = [p for p in paragraphs if len(p.split()) > 100]
+        long_paragraphs = sum(len(p.split()) > 100 for p in paragraphs)
         
         assessment = {
             'headings': len(headings),
             'lists': lists,
             'paragraphs': len(paragraphs),
-            'long_paragraphs': len(long_paragraphs),
+            'long_paragraphs': long_paragraphs,
             'recommendations': []
         }
         
@@ -106,9 +222,9 @@ class ContentAnalyzer:
                 "Add more descriptive headings to improve content organization"
             )
         
-        if len(long_paragraphs) > 0:
+        if long_paragraphs > 0:
             assessment['recommendations'].append(
-                f"Break down {len(long_paragraphs)} long paragraphs into shorter, more focused sections"
+                f"Break down {long_paragraphs} long paragraphs into shorter, more focused sections"
             )
         
         if lists < len(paragraphs) * 0.2:
@@ -120,16 +236,11 @@ class ContentAnalyzer:
     
     def analyze_completeness(self, content: str) -> Dict:
         """Analyze content completeness and examples."""
-        examples = len(re.findall(r'\b(?:Example|For example|To illustrate|Consider this example)\b', content, re.IGNORECASE))
-        steps = len(re.findall(r'\b(?:Step \d+|1\.|2\.|3\.)\b', content))
+        examples = len(_EXAMPLE_RE.findall(content))
+        steps = len(_STEP_RE.findall(content))
         
         # Check for common sections
-        sections = {
-            'prerequisites': 'prerequisites' in content.lower(),
-            'setup': 'setup' in content.lower(),
-            'configuration': 'configuration' in content.lower(),
-            'troubleshooting': 'troubleshooting' in content.lower()
-        }
+        sections = _find_keywords(content.lower())
         
         assessment = {
             'examples': examples,
@@ -157,45 +268,50 @@ class ContentAnalyzer:
         
         return assessment
     
-    def analyze_style(self, content: str) -> Dict:
+    def analyze_style(self, content: str, term_counts: Optional[Counter] = None,
+                      sentence_lengths: Optional[List[int]] = None) -> Dict:
         """Analyze content style against Microsoft Style Guide principles."""
-        sentences = sent_tokenize(content)
+        if term_counts is None:
+            term_counts = _count_terms(content)
+        if sentence_lengths is None:
+            sentence_lengths = _sentence_lengths(content)
+        sentence_count = len(sentence_lengths)
         
         # Analyze voice and tone
-        passive_voice = len(re.findall(r'\b(?:is|are|was|were|be|being|been)\b', content))
-        second_person = len(re.findall(r'\b(you|your)\b', content, re.IGNORECASE))
+        passive_voice = term_counts['passive']
+        second_person = term_counts['you']
         
         # Check for complex sentences
-        complex_sentences = [s for s in sentences if len(s.split()) > 25]
+        complex_sentences = sum(n > 25 for n in sentence_lengths)
         
         # Look for jargon
-        jargon = len(re.findall(r'\b(?:API|SDK|Integration|Analytics|Metrics|Segmentation|Campaign|Automation|Trigger|Event)\b', content, re.IGNORECASE))
+        jargon = term_counts['tech']
         
         assessment = {
             'passive_voice': passive_voice,
             'second_person': second_person,
-            'complex_sentences': len(complex_sentences),
+            'complex_sentences': complex_sentences,
             'jargon': jargon,
             'recommendations': []
         }
         
         # Generate recommendations
-        if passive_voice > len(sentences) * 0.2:
+        if passive_voice > sentence_count * 0.2:
             assessment['recommendations'].append(
                 "Reduce passive voice usage to make content more engaging"
             )
         
-        if second_person < len(sentences) * 0.3:
+        if second_person < sentence_count * 0.3:
             assessment['recommendations'].append(
                 "Use more second-person voice (you/your) to make content more personal"
             )
         
-        if len(complex_sentences) > len(sentences) * 0.2:
+        if complex_sentences > sentence_count * 0.2:
             assessment['recommendations'].append(
                 "Simplify complex sentences for better readability"
             )
         
-        if jargon > len(sentences) * 0.2:
+        if jargon > sentence_count * 0.2:
             assessment['recommendations'].append(
                 "Reduce technical jargon and provide clear explanations"
             )
@@ -204,33 +320,97 @@ class ContentAnalyzer:
     
     def analyze_content(self, url: str, content: str) -> Dict:
         """Perform comprehensive content analysis."""
+        term_counts = _count_terms(content)
+        sentence_lengths = _sentence_lengths(content)
         analysis = {
             'url': url,
-            'readability': self.analyze_readability(content),
+            'readability': self.analyze_readability(content, term_counts, sentence_lengths),
             'structure': self.analyze_structure(content),
             'completeness': self.analyze_completeness(content),
-            'style': self.analyze_style(content)
+            'style': self.analyze_style(content, term_counts, sentence_lengths)
         }
         
         return analysis
 
-def analyze_processed_content(input_file: str, output_file: str) -> None:
-    """Analyze processed content from JSON file."""
-    with open(input_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+_WORKER_ANALYZER = None
+_WORKER_CACHE_DIR = None
+
+def _init_worker() -> None:
+    """Build the per-process analyzer once when a pool worker starts."""
+    global _WORKER_ANALYZER, _WORKER_CACHE_DIR
+    _WORKER_ANALYZER = ContentAnalyzer()
+    _WORKER_CACHE_DIR = Path(AppConfig.get_cache_dir()) / 'content_analysis'
+    _WORKER_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    _get_textstat()
+    _get_punkt()
+    _get_sia()
+
+def _analyze_item(item: Dict) -> Dict:
+    """Analyze a single processed item inside a pool worker."""
+    # Newer processed files keep page text in a side file and only point at it
+    content = item.get('content')
+    if content is None:
+        content = Path(item['path']).read_text(encoding='utf-8')
+    digest = hashlib.sha1(content.encode('utf-8')).hexdigest()
+    cache_path = _WORKER_CACHE_DIR / f"{digest}.json"
     
-    analyzer = ContentAnalyzer()
-    results = []
+    # Unchanged content reuses the stored analysis; only the URL is refreshed
+    if cache_path.exists():
+        analysis = orjson.loads(cache_path.read_bytes())
+        analysis['url'] = item['url']
+        return analysis
     
-    for item in data:
-        if item['status'] == 'success':
-            analysis = analyzer.analyze_content(item['url'], item['content'])
-            results.append(analysis)
+    analysis = _WORKER_ANALYZER.analyze_content(item['url'], content)
+    tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+    tmp_path.write_bytes(orjson.dumps(analysis))
+    os.replace(tmp_path, cache_path)
+    return analysis
+
+def _read_items(f: BinaryIO) -> Iterator[Dict]:
+    """Stream items from either a JSON array or a JSON Lines file."""
+    if f.peek(1).lstrip()[:1] == b'[':
+        return ijson.items(f, 'item')
+    return ijson.items(f, '', multiple_values=True)
+
+def analyze_processed_content(input_file: str, output_file: str) -> None:
+    """Analyze processed content from a JSON or JSON Lines file."""
+    # Fail fast here rather than inside every pool worker's initializer,
+    # and fetch the tokenizer once before workers race to download it
+    AppConfig.get_api_key()
+    _get_punkt()
+    processes = os.cpu_count() or 1
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
+    # Stream items in and results out so neither file is held in memory
+    with open(input_file, 'rb') as f_in, open(output_file, 'wb') as f_out, \
+            multiprocessing.Pool(processes, initializer=_init_worker) as pool:
+        items = (item for item in _read_items(f_in) if item['status'] == 'success')
+        f_out.write(b'[')
+        first = True
+        # imap would drain the whole stream up front, so each result written
+        # frees a slot for the next item and the pool never sits idle
+        slots = threading.Semaphore(processes * 4)
+        stopped = threading.Event()
+
+        def feed() -> Iterator[Dict]:
+            for item in items:
+                slots.acquire()
+                if stopped.is_set():
+                    return
+                yield item
+
+        try:
+            for analysis in pool.imap(_analyze_item, feed()):
+                slots.release()
+                f_out.write(b'\n' if first else b',\n')
+                f_out.write(orjson.dumps(analysis, option=orjson.OPT_INDENT_2))
+                first = False
+        finally:
+            # Unblock the pool's feeder thread if we bail out early
+            stopped.set()
+            slots.release()
+        f_out.write(b']\n' if first else b'\n]\n')
 
 if __name__ == "__main__":
-    input_file = 'output/processed_content.json'
+    input_file = 'output/processed_content.jsonl'
     output_file = 'output/content_analysis.json'
     analyze_processed_content(input_file, output_file)
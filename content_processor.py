@@ -1,11 +1,18 @@
 import asyncio
-import json
+import concurrent.futures
+import csv
 import logging
+import multiprocessing
 import os
 import random
-from typing import Dict, List, Optional
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright
+import httpx
+import orjson
+import soupsieve
+from collections import Counter, OrderedDict
+from typing import Dict, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+from bs4 import BeautifulSoup, CData, NavigableString, Tag
+from playwright.async_api import Browser, BrowserContext, Error as PlaywrightError, TimeoutError as PlaywrightTimeoutError, async_playwright
 from config import AppConfig
 
 # Configure logging
@@ -15,319 +22,336 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-class ContentProcessor:
-    """Processor for extracting and analyzing web content."""
+# Resolved once so the launch args and every context present the same user agent
+_UA = AppConfig.get_user_agent()
+
+# Only text is extracted, so these resources are never worth downloading
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+
+# HEAD probes are cut short well before a page load would be
+_PROBE_TIMEOUT = 5.0
+
+# HEAD statuses meaning the server does not support the probe, not that the page is bad
+_PROBE_UNSUPPORTED = frozenset({405, 501})
+
+# Throttling and transient server errors are retried with jittered exponential backoff
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+_RETRY_ATTEMPTS = 3
+
+# Chromium network errors worth another try; DNS failures and refusals are not
+_TRANSIENT_NET_ERRORS = (
+    'net::ERR_CONNECTION_RESET',
+    'net::ERR_CONNECTION_CLOSED',
+    'net::ERR_CONNECTION_TIMED_OUT',
+    'net::ERR_TIMED_OUT',
+    'net::ERR_EMPTY_RESPONSE',
+    'net::ERR_NETWORK_CHANGED',
+    'net::ERR_HTTP2_PROTOCOL_ERROR'
+)
+
+# Returned by a single page load that failed in a way worth retrying
+_RETRY = object()
+
+# Start method for parse workers; forking a process with live threads can deadlock
+_WORKER_CONTEXT = multiprocessing.get_context(
+    'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+)
+
+# Most recent successful results kept per BatchProcessor
+_RESULT_CACHE_SIZE = 1024
+
+# Selectors and tag sets reused for every parsed page
+_BREADCRUMB_SEL = soupsieve.compile('.breadcrumb, .nav-breadcrumb')
+_HEADING_TAGS = frozenset({'h1', 'h2', 'h3', 'h4', 'h5', 'h6'})
+_STRIP_TAGS = frozenset({'script', 'style', 'nav', 'footer'})
+_TEXT_TYPES = (NavigableString, CData)
+
+# Columns of the per-URL CSV summary; list-valued fields stay in the JSONL output
+_SUMMARY_FIELDS = [
+    'url', 'title', 'success', 'error', 'word_count', 'section_count', 'image_count',
+    'readability_score', 'sentiment', 'complexity_score', 'structure_score'
+]
+
+# Keyword sets for the basic fallback analysis
+_POSITIVE_WORDS = frozenset({'good', 'great', 'excellent', 'best', 'amazing'})
+_NEGATIVE_WORDS = frozenset({'bad', 'poor', 'terrible', 'worst', 'awful'})
+_COMPLEX_WORDS = frozenset({'implementation', 'configuration', 'optimization', 'automation', 'integration'})
+
+# Candidate content containers, most specific first
+_CONTENT_SELECTORS = [
+    '.article-body',
+    '.article-content',
+    '.content-section',
+    '.main-content',
+    '#main-content',
+    'article',
+    'body'
+]
+
+# Compiled once; the combined selector finds every candidate in a single pass
+_CONTENT_SELS = [soupsieve.compile(selector) for selector in _CONTENT_SELECTORS]
+_CONTENT_SEL = soupsieve.compile(', '.join(_CONTENT_SELECTORS))
+
+# A container with no more text than this is passed over for the next candidate
+_MIN_CONTENT_CHARS = 100
+
+# Tracks in-flight fetch/XHR requests so waits can end once the page goes quiet
+_TRACK_REQUESTS_JS = """
+(() => {
+    window.__active = 0;
+    window.__lastActivity = Date.now();
+    const started = () => { window.__active++; window.__lastActivity = Date.now(); };
+    const finished = () => { window.__active--; window.__lastActivity = Date.now(); };
+    if (window.fetch) {
+        const originalFetch = window.fetch;
+        window.fetch = function (...args) {
+            started();
+            return originalFetch.apply(this, args).finally(finished);
+        };
+    }
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function (...args) {
+        started();
+        this.addEventListener('loadend', finished, {once: true});
+        return originalSend.apply(this, args);
+    };
+})();
+"""
+
+# True once no fetch/XHR has started or finished for 500 ms
+_NETWORK_QUIET_JS = "window.__active === 0 && Date.now() - window.__lastActivity >= 500"
+
+def _retry_delay(attempt: int) -> float:
+    """Get a random delay of up to 0.5 * 2**attempt seconds, capped at 8, before a retry."""
+    return min(0.5 * 2 ** attempt, 8.0) * random.random()
+
+async def _block_heavy_resources(route) -> None:
+    """Abort requests for resource types that text extraction never uses."""
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+class ContextPool:
+    """Fixed set of browser contexts, with every URL of a host pinned to one of them.
     
-    def __init__(self, url: str):
-        self.url = url
+    Keeping a host on one context lets Chromium reuse its TLS session and H2
+    connection across that host's pages, so contexts are shared rather than
+    checked out exclusively; the callers' semaphores bound how many pages run.
+    Because pages may share a context concurrently, cookies are not cleared
+    between uses: they persist for the hosts on a slot until it is recycled
+    into a fresh, cookie-free context after max_uses URLs.
+    """
+    
+    def __init__(self, browser: Browser, size: int, max_uses: int = 50):
+        self.browser = browser
+        self.size = size
+        self.max_uses = max_uses
+        self._contexts: List[BrowserContext] = []
+        self._uses: List[int] = []
+        self._active: List[int] = []
+        self._host_slots: Dict[str, int] = {}
+        self._recycling: Dict[int, asyncio.Event] = {}
         
-    async def fetch_content(self) -> Optional[str]:
-        """Fetch content using Playwright with enhanced error handling."""
-        try:
-            logger.info(f"Starting content fetch for {self.url}")
+    async def open(self) -> None:
+        """Create every context in the pool up front."""
+        for _ in range(self.size):
+            self._contexts.append(await self._new_context())
+            self._uses.append(0)
+            self._active.append(0)
             
-            async with async_playwright() as p:
-                # Launch browser
-                browser = await p.chromium.launch(
-                    headless=True,
-                    args=[
-                        '--no-sandbox',
-                        '--disable-gpu',
-                        '--disable-dev-shm-usage',
-                        '--window-size=1920,1080',
-                        f'--user-agent={AppConfig.get_user_agent()}'
-                    ]
-                )
-                
-                # Create context and page
-                context = await browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent=AppConfig.get_user_agent()
-                )
-                page = await context.new_page()
-                
-                try:
-                    # Navigate to URL with timeout
-                    await page.goto(self.url, timeout=30000)
-                    logger.info(f"Loaded URL: {page.url}")
-                    logger.info(f"Page title: {await page.title()}")
-                    
-                    # Wait for content to load
-                    await page.wait_for_load_state('networkidle', timeout=30000)
-                    
-                    # Try multiple strategies with retries
-                    max_retries = 3
-                    content = None
-                    
-                    for attempt in range(max_retries):
-                        try:
-                            logger.info(f"Attempt {attempt + 1} to extract content...")
-                            
-                            # Try different selectors
-                            selectors = [
-                                '.article-body',
-                                '.article-content',
-                                '.content-section',
-                                '.main-content',
-                                '#main-content',
-                                'article',
-                                'body'
-                            ]
-                            
-                            for selector in selectors:
-                                try:
-                                    logger.info(f"Trying selector: {selector}")
-                                    element = await page.wait_for_selector(
-                                        selector,
-                                        timeout=10000,
-                                        state='visible'
-                                    )
-                                    content = await element.text_content()
-                                    logger.info(f"Found content using selector {selector}. Length: {len(content)}")
-                                    break
-                                except:
-                                    logger.info(f"Selector {selector} not found")
-                                    continue
-                            
-                            if content and len(content) > 100:  # Consider successful if we got significant content
-                                break
-                                
-                            # If we didn't get enough content, try again with different strategy
-                            logger.info("Content too short, trying different strategy...")
-                            await asyncio.sleep(2)  # Wait a bit before retrying
-                            
-                        except Exception as e:
-                            logger.error(f"Attempt {attempt + 1} failed: {str(e)}")
-                            if attempt == max_retries - 1:
-                                logger.error("All attempts failed")
-                                content = ""
-                            else:
-                                await asyncio.sleep(2)  # Wait before next attempt
-                    
-                    logger.info(f"Final extracted content length: {len(content)}")
-                    logger.info(f"Current URL: {page.url}")
-                    logger.info(f"Page title: {await page.title()}")
-                    
-                    # Get page structure information
-                    try:
-                        # Count elements
-                        elements = await page.evaluate("""
-                            () => {
-                                const selectors = ['.article-body', '.article-content', '.content-section', '.main-content', '#main-content', 'article', 'body'];
-                                const counts = {};
-                                selectors.forEach(selector => {
-                                    counts[selector] = document.querySelectorAll(selector).length;
-                                });
-                                return counts;
-                            }
-                            """)
-                        logger.info(f"Page structure: {elements}")
-                    except Exception as e:
-                        logger.info(f"Error analyzing page structure: {str(e)}")
-                    
-                    return content
-                    
-                except Exception as e:
-                    logger.error(f"Error during content extraction: {str(e)}")
-                    logger.error(f"Current URL: {self.url}")
-                    return None
-                finally:
-                    # Cleanup
-                    await context.close()
-                    await browser.close()
-                    
+    async def _new_context(self) -> BrowserContext:
+        """Create a context configured for text extraction."""
+        context = await self.browser.new_context(
+            viewport={'width': 800, 'height': 600},
+            user_agent=_UA
+        )
+        await context.route("**/*", _block_heavy_resources)
+        await context.add_init_script(script=_TRACK_REQUESTS_JS)
+        return context
+    
+    def _slot_for(self, host: str) -> int:
+        """Get the context slot host is pinned to, assigning new hosts in turn."""
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = len(self._host_slots) % self.size
+        return slot
+        
+    async def acquire(self, url: str) -> BrowserContext:
+        """Get the context pinned to url's host."""
+        slot = self._slot_for(urlparse(url).netloc)
+        ready = self._recycling.get(slot)
+        if ready is not None:
+            await ready.wait()
+        self._active[slot] += 1
+        return self._contexts[slot]
+        
+    async def release(self, context: BrowserContext) -> None:
+        """Return a context, recycling it once it has served max_uses URLs and is idle."""
+        slot = self._contexts.index(context)
+        self._active[slot] -= 1
+        self._uses[slot] += 1
+        if self._uses[slot] < self.max_uses or self._active[slot] or slot in self._recycling:
+            return
+        # Long-lived contexts accumulate memory, so replace them periodically.
+        # The replacement is created first so a failure leaves the old, still
+        # open context in the slot; it is retried on the next idle release.
+        ready = self._recycling[slot] = asyncio.Event()
+        try:
+            try:
+                self._contexts[slot] = await self._new_context()
+            except Exception as e:
+                logger.error("Could not recycle browser context: %s", e)
+                return
+            self._uses[slot] = 0
+        finally:
+            del self._recycling[slot]
+            ready.set()
+        try:
+            await context.close()
         except Exception as e:
-            logger.error(f"Error fetching content: {str(e)}")
-            return None
+            logger.debug("Error closing recycled context: %s", e)
             
-            logger.info("Launching Chrome browser")
+    async def close(self) -> None:
+        """Close every context in the pool."""
+        for context in self._contexts:
+            await context.close()
+        self._contexts.clear()
+        self._uses.clear()
+        self._active.clear()
+        self._host_slots.clear()
+
+class ContentProcessor:
+    """Processor for extracting and analyzing web content.
+    
+    Holds no per-URL state, so one instance serves every URL in a run.
+    """
+    
+    def __init__(self, contexts: Optional['ContextPool'],
+                 executor: Optional[concurrent.futures.Executor] = None,
+                 client: Optional[httpx.AsyncClient] = None):
+        self.contexts = contexts
+        self.executor = executor
+        self.client = client
+        
+    async def probe(self, url: str) -> Optional[str]:
+        """HEAD the URL and return why it is not worth a browser visit, or None to fetch it.
+        
+        Connection failures, 429 and transient 5xx responses are retried first,
+        and left to the browser if they persist.
+        """
+        if self.client is None:
+            return None
+        for attempt in range(_RETRY_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(_retry_delay(attempt))
+            try:
+                response = await self.client.head(url, timeout=_PROBE_TIMEOUT)
+            except httpx.TransportError as e:
+                logger.debug("HEAD probe failed for %s: %s", url, e)
+                response = None
+                continue
+            except httpx.HTTPError as e:
+                logger.debug("HEAD probe failed for %s: %s", url, e)
+                return None
+            if response.status_code not in _RETRY_STATUSES:
+                break
+            logger.debug("HEAD probe for %s returned %d", url, response.status_code)
+        if response is None or response.status_code in _RETRY_STATUSES:
+            # Let the browser make the final call on hosts the probe cannot reach
+            # or that are still throttling or failing once retries run out
+            return None
+        if response.status_code in _PROBE_UNSUPPORTED:
+            return None
+        if response.status_code >= 400:
+            return f"HTTP {response.status_code}"
+        content_type = response.headers.get('Content-Type', '')
+        if content_type and 'html' not in content_type:
+            return f"Not HTML: {content_type}"
+        return None
+        
+    async def fetch_content(self, url: str) -> Optional[str]:
+        """Fetch the rendered page HTML.
+        
+        Loads answered with 429 or a transient 5xx, transient network errors and
+        navigations that time out before committing are retried with backoff;
+        any other failure returns None straight away.
+        """
+        for attempt in range(_RETRY_ATTEMPTS):
+            if attempt:
+                await asyncio.sleep(_retry_delay(attempt))
+            content = await self._fetch_once(url)
+            if content is not _RETRY:
+                return content
+        # Still throttled or erroring; the error page is not content
+        return None
+        
+    async def _fetch_once(self, url: str) -> Union[str, object, None]:
+        """Fetch the rendered page HTML once, or return _RETRY if the load is worth repeating."""
+        try:
+            logger.debug("Starting content fetch for %s", url)
             
-            # Initialize WebDriver
-            service = Service(ChromeDriverManager().install())
-            driver = webdriver.Chrome(service=service, options=chrome_options)
+            # Use the pooled context pinned to this host so its connections are reused
+            context = await self.contexts.acquire(url)
+            page = None
             
             try:
-                # First load base URL to establish session
-                logger.info(f"Loading base URL: {AppConfig.BASE_URL}")
+                page = await context.new_page()
+                
+                # Navigate with a short cap; a slow page is still extracted as far as it loaded
+                response = None
                 try:
-                    driver.get(AppConfig.BASE_URL)
-                    
-                    # Wait for page to load
-                    WebDriverWait(driver, 20).until(
-                        EC.presence_of_element_located((By.TAG_NAME, 'body'))
-                    )
-                    
-                    # Wait for JavaScript to execute
-                    WebDriverWait(driver, 20).until(
-                        EC.presence_of_element_located((By.TAG_NAME, 'html'))
-                    )
-                    
-                    # Execute JavaScript to handle dynamic content
-                    driver.execute_script("""
-                        // Remove any overlays or modals
-                        document.querySelectorAll('.modal, .overlay, .loading').forEach(el => {
-                            el.style.display = 'none';
-                        });
-                        
-                        // Handle iframes
-                        document.querySelectorAll('iframe').forEach(iframe => {
-                            iframe.style.display = 'block';
-                            iframe.style.width = '100%';
-                            iframe.style.height = '500px';
-                        });
-                        
-                        // Wait for all images to load
-                        return new Promise((resolve) => {
-                            let images = document.images.length;
-                            let loaded = 0;
-                            
-                            document.images.forEach(img => {
-                                if (img.complete) {
-                                    loaded++;
-                                } else {
-                                    img.onload = () => loaded++;
-                                    img.onerror = () => loaded++;
-                                }
-                            });
-                            
-                            if (loaded === images) {
-                                resolve(true);
-                            } else {
-                                setTimeout(() => {
-                                    resolve(true);
-                                }, 2000);
-                            }
-                        });
-                    """)
-                    
-                    # Check if we got the expected content
-                    page_title = driver.title
-                    logger.info(f"Base URL loaded successfully. Title: {page_title}")
-                    
-                except Exception as e:
-                    logger.error(f"Failed to load base URL: {str(e)}")
-                    logger.error(f"Current URL: {driver.current_url}")
-                    logger.error(f"Page source length: {len(driver.page_source)}")
+                    response = await page.goto(url, wait_until='domcontentloaded', timeout=8000)
+                except PlaywrightTimeoutError:
+                    if page.url == 'about:blank':
+                        # Nothing was committed, so there is no partial page to extract
+                        logger.debug("Navigation to %s timed out before loading", url)
+                        return _RETRY
+                    logger.debug("Navigation to %s timed out, extracting partial page", url)
+                except PlaywrightError as e:
+                    if any(code in str(e) for code in _TRANSIENT_NET_ERRORS):
+                        logger.debug("Transient network error loading %s: %s", url, e)
+                        return _RETRY
                     raise
+                if response is not None and response.status in _RETRY_STATUSES:
+                    logger.debug("%s returned %d", url, response.status)
+                    return _RETRY
+                logger.debug("Loaded URL: %s", page.url)
                 
-                # Try multiple times with exponential backoff
-                for attempt in range(AppConfig.get_retries()):
-                    try:
-                        logger.info(f"Attempt {attempt + 1}/{AppConfig.get_retries()} for {self.url}")
-                        
-                        # Add random delay before navigation
-                        await asyncio.sleep(random.uniform(1, 3))
-                        
-                        # Navigate to target URL
-                        logger.info(f"Navigating to: {self.url}")
-                        try:
-                            driver.get(self.url)
-                            
-                            # Wait for content to load
-                            WebDriverWait(driver, AppConfig.get_timeout()).until(
-                                EC.presence_of_element_located((By.TAG_NAME, 'body'))
-                            )
-                            
-                            # Wait for JavaScript to execute
-                            WebDriverWait(driver, AppConfig.get_timeout()).until(
-                                EC.presence_of_element_located((By.TAG_NAME, 'html'))
-                            )
-                            
-                            # Execute JavaScript to handle dynamic content
-                            driver.execute_script("""
-                                // Remove any overlays or modals
-                                document.querySelectorAll('.modal, .overlay, .loading').forEach(el => {
-                                    el.style.display = 'none';
-                                });
-                                
-                                // Handle iframes
-                                document.querySelectorAll('iframe').forEach(iframe => {
-                                    iframe.style.display = 'block';
-                                    iframe.style.width = '100%';
-                                    iframe.style.height = '500px';
-                                });
-                                
-                                // Wait for all images to load
-                                return new Promise((resolve) => {
-                                    let images = document.images.length;
-                                    let loaded = 0;
-                                    
-                                    document.images.forEach(img => {
-                                        if (img.complete) {
-                                            loaded++;
-                                        } else {
-                                            img.onload = () => loaded++;
-                                            img.onerror = () => loaded++;
-                                        }
-                                    });
-                                    
-                                    if (loaded === images) {
-                                        resolve(true);
-                                    } else {
-                                        setTimeout(() => {
-                                            resolve(true);
-                                        }, 2000);
-                                    }
-                                });
-                            """)
-                            
-                            # Check if we got the expected content
-                            page_title = driver.title
-                            logger.info(f"Target URL loaded successfully. Title: {page_title}")
-                            logger.info(f"Current URL: {driver.current_url}")
-                            logger.info(f"Page source length: {len(driver.page_source)}")
-                            
-                        except Exception as e:
-                            logger.error(f"Failed to load target URL: {str(e)}")
-                            logger.error(f"Current URL: {driver.current_url}")
-                            logger.error(f"Page source length: {len(driver.page_source)}")
-                            raise
-                        
-                        # Wait for dynamic content
-                        await asyncio.sleep(random.uniform(2, 5))
-                        
-                        # Get page content
-                        content = driver.page_source
-                        logger.info(f"Successfully fetched content for {self.url}")
-                        logger.debug(f"Content length: {len(content)}")
-                        
-                        # Close browser
-                        driver.quit()
-                        return content
-                    except Exception as e:
-                        logger.error(f"Attempt {attempt + 1}/{AppConfig.get_retries()} failed for {self.url}")
-                        logger.error(f"Error details: {str(e)}")
-                        logger.error(f"Error type: {type(e).__name__}")
-                        await asyncio.sleep(AppConfig.get_delay() * (attempt + 1))
+                # Wait briefly for XHR/fetch to go quiet; polling sites never reach networkidle
+                try:
+                    await page.wait_for_function(_NETWORK_QUIET_JS, timeout=3000, polling=100)
+                except PlaywrightTimeoutError:
+                    logger.debug("Network still busy after 3s, extracting anyway")
                 
-            except Exception as e:
-                logger.error(f"Error loading content")
-                logger.error(f"Error details: {str(e)}")
-                logger.error(f"Error type: {type(e).__name__}")
+                # Serialize the DOM once; content selection happens locally on the parsed tree
+                content = ""
+                try:
+                    content = await page.content()
+                except Exception as e:
+                    logger.error("Content extraction failed: %s", e)
                 
+                logger.debug("Final extracted content length: %d", len(content))
+                
+                return content
+                
+            except Exception as e:
+                logger.error("Error during content extraction: %s", e)
+                # page.url is tracked locally, so reading it costs no browser round-trip
+                logger.error("Current URL: %s", page.url if page is not None else url)
+                return None
             finally:
-                try:
-                    driver.quit()
-                except:
-                    pass
-            
-            return None
-        except Exception as e:
-            logger.error(f"Error fetching {self.url}")
-            logger.error(f"Error details: {str(e)}")
-            logger.error(f"Error type: {type(e).__name__}")
-            return None
+                # Cleanup
+                if page is not None:
+                    await page.close()
+                await self.contexts.release(context)
                 
         except Exception as e:
-            logger.error(f"Error fetching {self.url}")
-            logger.error(f"Error details: {str(e)}")
-            logger.error(f"Error type: {type(e).__name__}")
+            logger.error("Error fetching content: %s", e)
             return None
         
-    async def extract_metadata(self, content: str) -> Dict[str, str]:
-        """Extract metadata from content."""
-        soup = BeautifulSoup(content, 'html.parser')
-        
+    def extract_metadata(self, soup: BeautifulSoup, url: str) -> Dict[str, str]:
+        """Extract metadata from parsed content."""
         # Extract title
         title = self._extract_title(soup)
         
@@ -341,7 +365,7 @@ class ContentProcessor:
             'title': title,
             'description': description,
             'breadcrumbs': breadcrumbs,
-            'url': self.url,
+            'url': url,
             'timestamp': self._get_current_timestamp()
         }
     
@@ -362,7 +386,7 @@ class ContentProcessor:
     def _extract_breadcrumbs(self, soup: BeautifulSoup) -> List[str]:
         """Extract breadcrumb trail."""
         breadcrumbs = []
-        for element in soup.select('.breadcrumb, .nav-breadcrumb'):
+        for element in _BREADCRUMB_SEL.select(soup):
             for link in element.find_all('a'):
                 text = link.text.strip()
                 if text:
@@ -374,26 +398,24 @@ class ContentProcessor:
         from datetime import datetime
         return datetime.now().isoformat()
     
-    async def analyze_content(self, content: str) -> Dict:
-        """Analyze content for various metrics using API."""
-        soup = BeautifulSoup(content, 'html.parser')
-        
-        text_content = self._extract_text(soup)
+    def analyze_content(self, soup: BeautifulSoup) -> Dict:
+        """Analyze parsed content for various metrics using API."""
+        text_content, section_count, image_count, links = self._walk_once(soup)
         
         # Basic analysis
         basic_metrics = {
             'word_count': self._count_words(text_content),
-            'section_count': self._count_sections(soup),
-            'image_count': self._count_images(soup),
-            'links': self._extract_links(soup)
+            'section_count': section_count,
+            'image_count': image_count,
+            'links': links
         }
         
         # API-based analysis
-        api_metrics = await self._get_api_analysis(text_content)
+        api_metrics = self._get_api_analysis(text_content)
         
         return {**basic_metrics, **api_metrics}
     
-    async def _get_api_analysis(self, text: str) -> Dict:
+    def _get_api_analysis(self, text: str) -> Dict:
         """Get enhanced analysis using API with fallback."""
         try:
             # Get and validate API key
@@ -406,33 +428,32 @@ class ContentProcessor:
             logger.warning("API endpoints are not accessible, using basic analysis")
             return self._get_basic_analysis(text)
         except Exception as e:
-            logger.error(f"Error with API analysis: {str(e)}")
+            logger.error("Error with API analysis: %s", e)
             return self._get_basic_analysis(text)
     
     def _get_basic_analysis(self, text: str) -> Dict:
         """Get basic analysis as fallback."""
+        # Tokenize once for every keyword-based metric
+        word_counts = Counter(text.lower().split())
+        # Same piece count as len(text.split('.')), without building the list
+        sentence_count = text.count('.') + 1
         return {
-            'readability_score': self._calculate_readability(text),
-            'sentiment': self._get_basic_sentiment(text),
-            'complexity_score': self._count_complex_words(text),
-            'structure_score': self._analyze_structure(text)
+            'readability_score': self._calculate_readability(text, sentence_count),
+            'sentiment': self._get_basic_sentiment(word_counts),
+            'complexity_score': self._count_complex_words(word_counts),
+            'structure_score': self._analyze_structure(text, sentence_count)
         }
     
-    def _calculate_readability(self, text: str) -> float:
+    def _calculate_readability(self, text: str, sentence_count: int) -> float:
         """Calculate basic readability score."""
-        words = text.split()
-        sentences = text.split('.')
-        if len(sentences) > 1:
-            return len(words) / len(sentences)
+        if sentence_count > 1:
+            return self._count_words(text) / sentence_count
         return 0.0
     
-    def _get_basic_sentiment(self, text: str) -> str:
+    def _get_basic_sentiment(self, word_counts: Counter) -> str:
         """Basic sentiment analysis."""
-        positive_words = ['good', 'great', 'excellent', 'best', 'amazing']
-        negative_words = ['bad', 'poor', 'terrible', 'worst', 'awful']
-        
-        positive_count = sum(1 for word in text.lower().split() if word in positive_words)
-        negative_count = sum(1 for word in text.lower().split() if word in negative_words)
+        positive_count = sum(word_counts[word] for word in _POSITIVE_WORDS)
+        negative_count = sum(word_counts[word] for word in _NEGATIVE_WORDS)
         
         if positive_count > negative_count:
             return 'positive'
@@ -440,63 +461,104 @@ class ContentProcessor:
             return 'negative'
         return 'neutral'
     
-    def _count_complex_words(self, text: str) -> int:
+    def _count_complex_words(self, word_counts: Counter) -> int:
         """Count complex words (words with more than 3 syllables)."""
-        complex_words = ['implementation', 'configuration', 'optimization', 'automation', 'integration']
-        return sum(1 for word in text.lower().split() if word in complex_words)
+        return sum(word_counts[word] for word in _COMPLEX_WORDS)
     
-    def _analyze_structure(self, text: str) -> float:
+    def _analyze_structure(self, text: str, sentence_count: int) -> float:
         """Basic structure analysis."""
-        paragraphs = text.split('\n\n')
-        return len(paragraphs) / len(text.split('.')) if len(text.split('.')) > 0 else 0.0
+        paragraph_count = text.count('\n\n') + 1
+        return paragraph_count / sentence_count
     
-    def _extract_text(self, soup: BeautifulSoup) -> str:
-        """Extract main text content."""
-        # Remove unwanted elements
-        for elem in soup(['script', 'style', 'nav', 'footer']):
-            elem.decompose()
-        
-        # Get main content
-        main_content = soup.find('main') or soup.find('article')
-        if not main_content:
-            main_content = soup
-        
-        return main_content.get_text(separator='\n', strip=True)
+    def _walk_once(self, soup: BeautifulSoup) -> Tuple[str, int, int, List[str]]:
+        """Gather main text, heading and image counts and links in one traversal.
+        
+        Script, style, nav and footer subtrees are skipped entirely. Text comes
+        from the first match of the earliest _CONTENT_SELECTORS entry holding more
+        than _MIN_CONTENT_CHARS characters, else from <body>, else the whole page.
+        """
+        # First match per selector, keyed by element so the walk can spot them
+        containers: Dict[int, List[int]] = {}
+        found = set()
+        for element in _CONTENT_SEL.select(soup):
+            for rank, sel in enumerate(_CONTENT_SELS):
+                if rank not in found and sel.match(element):
+                    found.add(rank)
+                    containers.setdefault(id(element), []).append(rank)
+        
+        headings = 0
+        images = 0
+        links = []
+        parts = []
+        # rank -> [start, end) slice of parts covered by that container
+        spans = {}
+        
+        stack = [soup]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, tuple):
+                # Leaving a container; its text ends here
+                for rank in containers[node[0]]:
+                    spans[rank][1] = len(parts)
+                continue
+            if isinstance(node, Tag):
+                name = node.name
+                if name in _STRIP_TAGS:
+                    continue
+                if name in _HEADING_TAGS:
+                    headings += 1
+                elif name == 'img':
+                    images += 1
+                elif name == 'a':
+                    # Read the attribute dict directly; Tag.get is a wrapper around it
+                    href = node.attrs.get('href')
+                    if href is not None and href.startswith('http'):
+                        links.append(href)
+                ranks = containers.get(id(node))
+                if ranks:
+                    for rank in ranks:
+                        spans[rank] = [len(parts), None]
+                    stack.append((id(node),))
+                stack.extend(reversed(node.contents))
+            elif type(node) in _TEXT_TYPES:
+                text = node.strip()
+                if text:
+                    parts.append(text)
+        
+        for rank in sorted(spans):
+            start, end = spans[rank]
+            text = '\n'.join(parts[start:end])
+            if len(text) > _MIN_CONTENT_CHARS:
+                return text, headings, images, links
+        # The last selector is body, which is used however short it is
+        body = spans.get(len(_CONTENT_SELS) - 1)
+        if body:
+            parts = parts[body[0]:body[1]]
+        return '\n'.join(parts), headings, images, links
+    
+    def extract_text(self, content: str) -> str:
+        """Get the main text of fetched page HTML."""
+        return self._walk_once(BeautifulSoup(content, 'lxml'))[0]
     
     def _count_words(self, text: str) -> int:
         """Count words in text."""
         return len(text.split())
     
-    def _count_sections(self, soup: BeautifulSoup) -> int:
-        """Count sections in content."""
-        headings = soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-        return len(headings)
-    
-    def _count_images(self, soup: BeautifulSoup) -> int:
-        """Count images in content."""
-        return len(soup.find_all('img'))
-    
-    def _extract_links(self, soup: BeautifulSoup) -> List[str]:
-        """Extract all links from content."""
-        links = []
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            if href.startswith('http'):
-                links.append(href)
-        return links
-    
-    async def process_url(self) -> Dict:
+    async def process_url(self, url: str) -> Dict:
         """Process a single URL completely."""
-        content = await self.fetch_content()
+        content = await self.fetch_content(url)
         if not content:
-            return {'url': self.url, 'error': 'Failed to fetch content'}
-            
-        metadata = await self.extract_metadata(content)
-        analysis = await self.analyze_content(content)
+            return {'url': url, 'error': 'Failed to fetch content'}
+        
+        # Parsing is CPU-bound, so hand it to the process pool when there is one
+        if self.executor is None:
+            parsed = _parse_page(url, content)
+        else:
+            loop = asyncio.get_running_loop()
+            parsed = await loop.run_in_executor(self.executor, _parse_page, url, content)
         
         return {
-            **metadata,
-            **analysis,
+            **parsed,
             'success': True
         }
     
@@ -504,57 +566,217 @@ class ContentProcessor:
         """Close the HTTP session."""
         # No need to close the session as it's handled by Playwright
 
+# Browserless instance for the parsing steps, shared by every _parse_page call in a process
+_PAGE_PARSER = ContentProcessor(None)
+
+def create_client(max_connections: int = AppConfig.MAX_CONCURRENCY) -> httpx.AsyncClient:
+    """Create a pooled HTTP/2 client sending the same user agent as the browser.
+    
+    The default headers already offer br; the brotli extra lets httpx decode it.
+    """
+    limits = httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections)
+    return httpx.AsyncClient(
+        headers={**AppConfig.get_default_headers(), 'User-Agent': _UA},
+        limits=limits,
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        follow_redirects=True,
+        # Same-host requests multiplex over one connection instead of queueing for a socket
+        http2=True
+    )
+
+def _parse_page(url: str, content: str) -> Dict:
+    """Extract metadata and analysis from fetched HTML.
+    
+    Module-level so it can be pickled into ProcessPoolExecutor workers.
+    """
+    # Parse once and share the tree between metadata and analysis
+    soup = BeautifulSoup(content, 'lxml')
+    return {**_PAGE_PARSER.extract_metadata(soup, url), **_PAGE_PARSER.analyze_content(soup)}
+
+def extract_page_text(content: str) -> str:
+    """Get the main text of fetched HTML; module-level so executor workers can run it."""
+    return _PAGE_PARSER.extract_text(content)
+
+class ResultWriter:
+    """Writer appending results to a JSONL file and a CSV summary as they arrive."""
+    
+    def __init__(self, output_dir: str):
+        self.json_path = os.path.join(output_dir, 'processed_content.jsonl')
+        self.csv_path = os.path.join(output_dir, 'processed_summary.csv')
+        
+    def __enter__(self) -> 'ResultWriter':
+        self._json_file = open(self.json_path, 'wb')
+        self._csv_file = open(self.csv_path, 'w', newline='', encoding='utf-8')
+        self._summary = csv.DictWriter(self._csv_file, fieldnames=_SUMMARY_FIELDS, extrasaction='ignore')
+        self._summary.writeheader()
+        return self
+        
+    def write(self, result: Dict) -> None:
+        """Append one result to both files."""
+        self._json_file.write(orjson.dumps(result, option=orjson.OPT_APPEND_NEWLINE))
+        self._summary.writerow(result)
+        
+    def __exit__(self, exc_type, exc, tb) -> None:
+        try:
+            self._json_file.close()
+        finally:
+            self._csv_file.close()
+
 class BatchProcessor:
     """Processor for handling multiple URLs in batches."""
     
-    def __init__(self, urls: List[str], batch_size: int = AppConfig.BATCH_SIZE):
-        self.urls = urls
+    def __init__(self, urls: List[str], batch_size: int = AppConfig.BATCH_SIZE,
+                 client: Optional[httpx.AsyncClient] = None):
+        # Each distinct URL is fetched once per run
+        self.urls = list(dict.fromkeys(urls))
         self.batch_size = batch_size
+        self.browser: Optional[Browser] = None
+        self.contexts: Optional[ContextPool] = None
+        self.executor: Optional[concurrent.futures.ProcessPoolExecutor] = None
+        self.processor: Optional[ContentProcessor] = None
+        # A caller-supplied client is shared with the caller and left open on exit
+        self.client = client
+        self._owns_client = client is None
+        self._playwright = None
+        self.sem = asyncio.Semaphore(AppConfig.MAX_CONCURRENCY)
+        self._host_sems: Dict[str, asyncio.Semaphore] = {}
+        self._cache: 'OrderedDict[str, Dict]' = OrderedDict()
         
-    async def process_batch(self, start_idx: int) -> List[Dict]:
-        """Process a batch of URLs."""
-        batch_urls = self.urls[start_idx:start_idx + self.batch_size]
-        tasks = []
+    async def __aenter__(self) -> 'BatchProcessor':
+        """Launch one browser shared by every URL in the run."""
+        # Pages are parsed on every core while the event loop keeps driving the browser.
+        # Workers start lazily, after Playwright and httpx have threads running, so
+        # they come from a clean forkserver (or spawn) rather than forking this process
+        self.executor = concurrent.futures.ProcessPoolExecutor(
+            max_workers=os.cpu_count(), mp_context=_WORKER_CONTEXT
+        )
+        if self._owns_client:
+            self.client = create_client()
+        self._playwright = await async_playwright().start()
+        self.browser = await self._playwright.chromium.launch(
+            headless=True,
+            args=[
+                '--no-sandbox',
+                '--disable-gpu',
+                '--disable-dev-shm-usage',
+                f'--user-agent={_UA}'
+            ]
+        )
+        # One reusable context per concurrency slot
+        self.contexts = ContextPool(self.browser, AppConfig.MAX_CONCURRENCY)
+        await self.contexts.open()
+        self.processor = ContentProcessor(self.contexts, self.executor, self.client)
+        return self
         
-        for url in batch_urls:
-            processor = ContentProcessor(url)
-            tasks.append(processor.process_url())
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the context pool and shared browser, then stop Playwright and the parse workers."""
+        try:
+            await self.contexts.close()
+            await self.browser.close()
+        finally:
+            await self._playwright.stop()
+            if self._owns_client:
+                await self.client.aclose()
+                self.client = None
+            self.executor.shutdown()
+            self.browser = None
+            self.contexts = None
+            self.executor = None
+            self.processor = None
+            self._playwright = None
         
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+    def _host_sem(self, url: str) -> asyncio.Semaphore:
+        """Get the semaphore limiting concurrent requests to url's host."""
+        host = urlparse(url).netloc
+        sem = self._host_sems.get(host)
+        if sem is None:
+            sem = self._host_sems[host] = asyncio.Semaphore(AppConfig.PER_HOST_CONCURRENCY)
+        return sem
+    
+    async def _run_one(self, url: str, queue: Optional[asyncio.Queue] = None) -> Optional[Dict]:
+        """Process one URL once both a global and a per-host slot are free.
+        
+        With a queue, the result is handed to the writer task instead of returned.
+        Successful results are kept so a later run on this processor skips the fetch.
+        """
+        result = self._cache.get(url)
+        if result is not None:
+            self._cache.move_to_end(url)
+        else:
+            async with self.sem, self._host_sem(url):
+                # A cheap HEAD weeds out dead and non-HTML URLs before a page is opened
+                skipped = await self.processor.probe(url)
+                if skipped is None:
+                    result = await self.processor.process_url(url)
+                else:
+                    logger.info("Skipping %s: %s", url, skipped)
+                    result = {'url': url, 'error': f"Skipped: {skipped}"}
+            if result.get('success'):
+                self._cache[url] = result
+                if len(self._cache) > _RESULT_CACHE_SIZE:
+                    self._cache.popitem(last=False)
+        if queue is None:
+            return result
+        queue.put_nowait(result)
+        return None
+    
+    @staticmethod
+    async def _drain_results(queue: asyncio.Queue, writer: ResultWriter) -> None:
+        """Write queued results until the None sentinel arrives."""
+        while True:
+            result = await queue.get()
+            if result is None:
+                break
+            writer.write(result)
+    
+    async def process_batch(self, start_idx: int) -> List[Dict]:
+        """Process a batch of URLs; must be called inside ``async with`` this processor."""
+        # gather(return_exceptions=True) would otherwise hide the missing processor as []
+        if self.processor is None:
+            raise RuntimeError("process_batch needs an open BatchProcessor; use 'async with'")
+        batch_urls = self.urls[start_idx:start_idx + self.batch_size]
+        results = await asyncio.gather(
+            *(self._run_one(url) for url in batch_urls), return_exceptions=True
+        )
         
         return [r for r in results if not isinstance(r, Exception)]
     
-    async def process_all(self) -> List[Dict]:
-        """Process all URLs in batches."""
-        all_results = []
-        total_batches = (len(self.urls) + self.batch_size - 1) // self.batch_size
+    async def process_all(self, output_dir: Optional[str] = None) -> List[Dict]:
+        """Process all URLs, keeping up to MAX_CONCURRENCY in flight.
         
-        print(f"Processing {len(self.urls)} URLs in {total_batches} batches")
+        When output_dir is given, each result is written to disk as soon as it
+        finishes instead of being kept in memory, and an empty list is returned.
+        """
+        logger.info("Processing %d URLs with up to %d in flight", len(self.urls), AppConfig.MAX_CONCURRENCY)
         
-        for i in range(0, len(self.urls), self.batch_size):
-            print(f"Processing batch {i//self.batch_size + 1}/{total_batches}")
-            batch_results = await self.process_batch(i)
-            all_results.extend(batch_results)
-            
-            if i + self.batch_size < len(self.urls):
-                await asyncio.sleep(AppConfig.DEFAULT_DELAY)
+        if output_dir is None:
+            # A finished URL frees its slot for the next one instead of waiting on its batch
+            async with self:
+                results = await asyncio.gather(
+                    *(self._run_one(url) for url in self.urls), return_exceptions=True
+                )
+            return [r for r in results if not isinstance(r, Exception)]
         
-        return all_results
+        queue: asyncio.Queue = asyncio.Queue()
+        with ResultWriter(output_dir) as writer:
+            drain = asyncio.create_task(self._drain_results(queue, writer))
+            try:
+                async with self:
+                    await asyncio.gather(
+                        *(self._run_one(url, queue) for url in self.urls), return_exceptions=True
+                    )
+            finally:
+                queue.put_nowait(None)
+                await drain
+        return []
     
     @staticmethod
-    def save_results(results: List[Dict], output_dir: str = AppConfig.get_output_dir()):
-        """Save results to JSON and CSV files."""
-        import pandas as pd
-        
-        json_path = os.path.join(output_dir, 'processed_content.json')
-        csv_path = os.path.join(output_dir, 'processed_summary.csv')
-        
-        # Save JSON
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
-        
-        # Save CSV
-        df = pd.DataFrame(results)
-        df.to_csv(csv_path, index=False)
+    def save_results(results: List[Dict], output_dir: Optional[str] = None):
+        """Save results to JSONL and CSV files, by default in the configured output directory."""
+        if output_dir is None:
+            output_dir = AppConfig.get_output_dir()
+        with ResultWriter(output_dir) as writer:
+            for result in results:
+                writer.write(result)
         
-        return json_path, csv_path
+        return writer.json_path, writer.csv_path
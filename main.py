@@ -1,12 +1,25 @@
 import argparse
 import asyncio
-import json
+import csv
+import hashlib
 import logging
+import os
+import sys
+import httpx
+import orjson
+from lxml import etree
 from pathlib import Path
-from typing import List, Dict, Optional
-from content_processor import ContentProcessor
+from urllib.parse import urlparse
+from typing import Any, AsyncIterator, BinaryIO, List, Dict, Optional
+from content_processor import BatchProcessor, ContentProcessor, create_client, extract_page_text
 from config import AppConfig
 
+# Use uvloop's libuv-based event loop when available
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -14,6 +27,9 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Site-relative links, selected and filtered inside lxml in one query
+_RELATIVE_LINKS = etree.XPath('//a[starts-with(@href, "/")]/@href', smart_strings=False)
+
 def create_parser() -> argparse.ArgumentParser:
     """Create command line argument parser."""
     parser = argparse.ArgumentParser(
@@ -34,7 +50,7 @@ def create_parser() -> argparse.ArgumentParser:
     )
     discover_parser.add_argument(
         '--output',
-        default=os.path.join(AppConfig.get_output_dir(), 'discovered_urls.json'),
+        default=os.path.join(AppConfig.OUTPUT_DIR, 'discovered_urls.json'),
         help='Output file for discovered URLs'
     )
     
@@ -44,8 +60,13 @@ def create_parser() -> argparse.ArgumentParser:
         help='Process content from URLs'
     )
     process_parser.add_argument(
-        '--urls',
-        required=True,
+        'urls',
+        nargs='*',
+        help='URLs to process'
+    )
+    process_parser.add_argument(
+        '--urls', '--urls-file',
+        dest='urls_file',
         help='File containing URLs to process (one per line)'
     )
     process_parser.add_argument(
@@ -58,40 +79,81 @@ def create_parser() -> argparse.ArgumentParser:
         '--delay',
         type=float,
         default=AppConfig.DEFAULT_DELAY,
-        help='Delay between batches in seconds'
+        help='Seconds per batch-size request starts; starts are spaced delay/batch-size apart'
+    )
+    process_parser.add_argument(
+        '--output-dir',
+        default=AppConfig.OUTPUT_DIR,
+        help='Directory to save results'
+    )
+    process_parser.add_argument(
+        '--output-format',
+        choices=['ndjson', 'json'],
+        default='ndjson',
+        help='Write results as JSON Lines (default) or as a single JSON array'
     )
     
     return parser
 
-async def discover_urls(base_url: str, output_file: str) -> None:
+async def discover_urls(client: httpx.AsyncClient, base_url: str, output_file: str) -> None:
     """Discover URLs from a base URL."""
-    print(f"Discovering URLs from {base_url}...")
+    logger.info("Discovering URLs from %s...", base_url)
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(base_url)
+        async with client.stream('GET', base_url) as response:
             response.raise_for_status()
-            
-            # Simple discovery - find all links
-            soup = BeautifulSoup(response.text, 'html.parser')
-            links = []
-            
-            for link in soup.find_all('a', href=True):
-                href = link['href']
-                if href.startswith('/'):
-                    links.append(href)
-                    
-            with open(output_file, 'w') as f:
-                json.dump(links, f, indent=2)
+            # Parse chunks as they arrive instead of after the whole body is buffered.
+            # A plain etree parser: lxml.html's element classes are not needed for hrefs
+            parser = etree.HTMLParser(encoding=response.charset_encoding)
+            async for chunk in response.aiter_bytes(65536):
+                parser.feed(chunk)
+            root = parser.close()
+        
+        # Simple discovery - find all site-relative links
+        links = _RELATIVE_LINKS(root)
+        
+        # Keep disk I/O off the event loop
+        data = orjson.dumps(links, option=orjson.OPT_INDENT_2)
+        await asyncio.get_running_loop().run_in_executor(None, Path(output_file).write_bytes, data)
                 
     except Exception as e:
-        print(f"Error discovering URLs: {str(e)}")
+        logger.error("Error discovering URLs: %s", e)
 
-async def process_url(url: str) -> Dict:
+def _write_result(f_json: BinaryIO, summary: Any, pages_dir: Path, result: Dict,
+                  prefix: bytes = b'', option: int = orjson.OPT_APPEND_NEWLINE) -> None:
+    """Save a page's text to pages_dir and append its result to the JSON output and CSV summary.
+    
+    The defaults write one NDJSON line; JSON array output passes its separator as prefix.
+    """
+    content = result.pop('content', None)
+    if content is not None:
+        # The output record points at the page file instead of embedding the text
+        name = hashlib.blake2b(result['url'].encode('utf-8'), digest_size=8).hexdigest()
+        page_path = pages_dir / f"{name}.txt"
+        page_path.write_text(content, encoding='utf-8')
+        # Absolute, so the analyzer can open it from any working directory
+        result['path'] = str(page_path.resolve())
+    f_json.write(prefix)
+    f_json.write(orjson.dumps(result, option=option))
+    summary.writerow((result['url'], result['status'], result.get('length', 0), result.get('error', '')))
+
+async def process_url(processor: ContentProcessor, url: str) -> Dict:
     """Process a single URL and return analysis results."""
     try:
-        processor = ContentProcessor(url)
-        content = await processor.fetch_content()
+        skipped = await processor.probe(url)
+        if skipped:
+            return {
+                'url': url,
+                'status': 'error',
+                'error': f"Skipped: {skipped}"
+            }
+        
+        html = await processor.fetch_content(url)
+        content = None
+        if html:
+            # Parsing is CPU-bound, so it runs in the processor's pool like BatchProcessor's pages
+            loop = asyncio.get_running_loop()
+            content = await loop.run_in_executor(processor.executor, extract_page_text, html)
         
         if content:
             return {
@@ -107,94 +169,140 @@ async def process_url(url: str) -> Dict:
                 'error': 'No content extracted'
             }
     except Exception as e:
-        logger.error(f"Error processing URL {url}: {str(e)}")
+        logger.error("Error processing URL %s: %s", url, e)
         return {
             'url': url,
             'status': 'error',
             'error': str(e)
         }
 
-async def process_batch(urls: List[str], batch_size: int = 3, delay: float = 2.0) -> List[Dict]:
-    """Process a batch of URLs with rate limiting."""
-    results = []
+async def process_batch(client: httpx.AsyncClient, urls: List[str], batch_size: int = 3,
+                        delay: float = 2.0) -> AsyncIterator[Dict]:
+    """Process URLs with batch_size in flight, yielding each result as it finishes.
     
-    for i in range(0, len(urls), batch_size):
-        batch = urls[i:i + batch_size]
-        logger.info(f"Processing batch {i//batch_size + 1}/{(len(urls) + batch_size - 1)//batch_size}")
-        
-        # Process batch asynchronously
-        batch_results = await asyncio.gather(*[
-            process_url(url) for url in batch
-        ])
-        results.extend(batch_results)
-        
-        # Delay between batches
-        if i + batch_size < len(urls):
-            logger.info(f"Waiting {delay} seconds before next batch...")
-            await asyncio.sleep(delay)
+    At most batch_size requests start per delay seconds.
+    """
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(batch_size)
+    # Each host also gets its own small limit so one origin cannot take every slot
+    host_sems: Dict[str, asyncio.Semaphore] = {}
+    # Throttle each request start instead of pausing the whole run between batches
+    interval = delay / max(batch_size, 1)
+    next_start = loop.time()
+    
+    def host_sem(url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc
+        host_limit = host_sems.get(host)
+        if host_limit is None:
+            host_limit = host_sems[host] = asyncio.Semaphore(AppConfig.PER_HOST_CONCURRENCY)
+        return host_limit
     
-    return results
+    async def bounded(url: str, processor: ContentProcessor) -> Dict:
+        nonlocal next_start
+        # Wait on the host first so a busy host does not hold a global slot
+        async with host_sem(url), sem:
+            now = loop.time()
+            wait = next_start - now
+            next_start = max(now, next_start) + interval
+            if wait > 0:
+                await asyncio.sleep(wait)
+            return await process_url(processor, url)
+    
+    # Every URL reuses one browser, its pooled contexts and a single processor
+    async with BatchProcessor(urls, batch_size, client) as batch_processor:
+        logger.info("Processing up to %d URLs at a time", batch_size)
+        processor = batch_processor.processor
+        for task in asyncio.as_completed([bounded(url, processor) for url in urls]):
+            yield await task
 
 async def main():
-    parser = argparse.ArgumentParser(description="Documentation Content Analyzer")
-    parser.add_argument('urls', nargs='*', help='URLs to analyze')
-    parser.add_argument('--urls-file', help='File containing URLs to analyze')
-    parser.add_argument('--batch-size', type=int, default=3, help='Number of URLs to process in parallel')
-    parser.add_argument('--delay', type=float, default=2.0, help='Delay between batches in seconds')
-    parser.add_argument('--output-dir', default='output', help='Directory to save results')
-    
+    parser = create_parser()
     args = parser.parse_args()
     
+    if args.command == 'discover':
+        if not args.url:
+            parser.error("No base URL provided; pass --url or set CONTENT_ANALYZER_BASE_URL")
+        # Output directories are only created once there is something to write
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        async with create_client() as client:
+            await discover_urls(client, args.url, args.output)
+        return
+    
     # Create output directory
     output_dir = Path(args.output_dir)
-    output_dir.mkdir(exist_ok=True)
+    output_dir.mkdir(parents=True, exist_ok=True)
     
     # Get URLs to process
     urls = args.urls
     if args.urls_file:
-        with open(args.urls_file, 'r') as f:
-            urls.extend(line.strip() for line in f if line.strip())
+        text = Path(args.urls_file).read_text()
+        urls.extend(url for url in map(str.strip, text.splitlines()) if url)
     
     if not urls:
         parser.error("No URLs provided")
         return
     
-    logger.info(f"Processing {len(urls)} URLs")
-    
-    # Process URLs
-    results = await process_batch(urls, args.batch_size, args.delay)
+    logger.info("Processing %d URLs", len(urls))
     
-    # Save results
-    json_output = output_dir / 'processed_content.json'
+    as_array = args.output_format == 'json'
+    json_output = output_dir / ('processed_content.json' if as_array else 'processed_content.jsonl')
+    pages_dir = output_dir / 'pages'
+    pages_dir.mkdir(exist_ok=True)
     csv_output = output_dir / 'processed_summary.csv'
+    loop = asyncio.get_running_loop()
+    # Page text goes straight to disk; only the counts are kept for statistics
+    successful = failed = 0
     
-    # Save JSON
-    with open(json_output, 'w', encoding='utf-8') as f:
-        json.dump(results, f, indent=2, ensure_ascii=False)
-    
-    # Save CSV summary
-    with open(csv_output, 'w', encoding='utf-8') as f:
-        f.write("URL,Status,Content Length,Error\n")
-        for result in results:
-            f.write(f"{result['url']},{result['status']},{result.get('length', 0)},""")
-            if result['status'] == 'error':
-                f.write(f"{result['error']}")
-            f.write("\n")
+    # Process URLs over one pooled client so keep-alive connections are reused
+    with open(json_output, 'wb') as f_json, \
+            open(csv_output, 'w', newline='', encoding='utf-8') as f_csv:
+        summary = csv.writer(f_csv)
+        summary.writerow(["URL", "Status", "Content Length", "Error"])
+        if as_array:
+            # The array is still written element by element, never held in memory
+            f_json.write(b'[')
+        async with create_client(args.batch_size * 4) as client:
+            async for result in process_batch(client, urls, args.batch_size, args.delay):
+                # Each result is written as its URL finishes; the encode and
+                # write of large pages runs in a thread so fetches keep going
+                if as_array:
+                    first = not (successful or failed)
+                    await loop.run_in_executor(None, _write_result, f_json, summary, pages_dir, result,
+                                               b'\n' if first else b',\n', 0)
+                else:
+                    await loop.run_in_executor(None, _write_result, f_json, summary, pages_dir, result)
+                if result['status'] == 'success':
+                    successful += 1
+                else:
+                    failed += 1
+        if as_array:
+            f_json.write(b'\n]\n' if successful or failed else b']\n')
     
     # Print statistics
-    successful = len([r for r in results if r['status'] == 'success'])
-    failed = len([r for r in results if r['status'] == 'error'])
-    total = len(results)
+    total = successful + failed
+    # A run where every task died before yielding a result has nothing to divide by
+    success_rate = successful / total * 100 if total else 0.0
     
     logger.info("\nProcessing complete!")
-    logger.info(f"Results saved to:")
-    logger.info(f"  JSON: {json_output}")
-    logger.info(f"  CSV: {csv_output}")
+    logger.info("Results saved to:")
+    logger.info("  JSON: %s", json_output)
+    logger.info("  CSV: %s", csv_output)
     logger.info("\nStatistics:")
-    logger.info(f"  Total URLs: {total}")
-    logger.info(f"  Successful: {successful}")
-    logger.info(f"  Failed: {failed}")
-    logger.info(f"  Success rate: {(successful/total)*100:.1f}%")
+    logger.info("  Total URLs: %d", total)
+    logger.info("  Successful: %d", successful)
+    logger.info("  Failed: %d", failed)
+    logger.info("  Success rate: %.1f%%", success_rate)
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    if uvloop is None:
+        asyncio.run(main())
+    elif sys.version_info >= (3, 12):
+        asyncio.run(main(), loop_factory=uvloop.new_event_loop)
+    elif sys.version_info >= (3, 11):
+        # asyncio.run gained loop_factory in 3.12, but 3.11's Runner already takes one
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main())
+    else:
+        # No loop_factory hook before 3.11; install() is only deprecated from 3.12
+        uvloop.install()
+        asyncio.run(main())